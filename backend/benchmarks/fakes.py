@@ -0,0 +1,162 @@
+"""
+Local HTTP stand-ins for OpenAI chat completions and the Google Calendar API.
+
+Both run a ThreadingHTTPServer on 127.0.0.1 in a daemon thread and sleep `latency`
+seconds per request to simulate the upstream round trip. Point the app at them with
+OPENAI_BASE_URL and GOOGLE_CALENDAR_API_URL (see `base_url` on each server).
+"""
+import json
+import threading
+import time
+import uuid
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def fake_analysis(index=0):
+    """A contract analysis shaped like the one `call_openai_analysis` gets from the model."""
+    expiry = date.today() + timedelta(days=60 + index % 700)
+    flags = ["auto_renewal", "exit_penalty", "non_compete", "long_commitment", "price_increase"]
+    return {
+        "subject": f"Service Agreement {index}",
+        "party": f"Vendor {index % 250} Ltd",
+        "expiry_date": expiry.isoformat(),
+        "conclusion": "Annual software subscription with a 60-day termination notice.",
+        "summary": (
+            "**Key points**\n- Annual subscription, billed monthly\n- Support included\n\n"
+            "**Obligations**\n- Pay within 30 days of invoice\n\n"
+            "**Risks**\n- Auto-renews unless cancelled\n\n**Bottom line**\nStandard SaaS terms."
+        ),
+        "annual_value": 1200 + (index % 97) * 150,
+        "has_auto_renewal": index % 3 == 0,
+        "notice_period_days": (30, 60, 90)[index % 3],
+        "risk_flags": flags[: index % 4],
+        "risk_flags_note": "Auto-renews annually unless 60 days notice given." if index % 3 == 0 else "",
+        "is_signed": index % 5 != 0,
+    }
+
+
+class _FakeServer:
+    """Base class: serve `handler_class` on an ephemeral port until `stop()`."""
+
+    path_prefix = ""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.path_prefix}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _count(self):
+        with self._lock:
+            self.requests += 1
+
+    def handle(self, method, path, body):
+        """Return (status, payload dict or None)."""
+        raise NotImplementedError
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else None
+                fake._count()
+                if fake.latency:
+                    time.sleep(fake.latency)
+                status, payload = fake.handle(method, self.path, body)
+                data = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                if data:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                if data:
+                    self.wfile.write(data)
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_PUT(self):
+                self._dispatch("PUT")
+
+            def do_PATCH(self):
+                self._dispatch("PATCH")
+
+            def do_DELETE(self):
+                self._dispatch("DELETE")
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class FakeOpenAI(_FakeServer):
+    """`POST /v1/chat/completions` returning a JSON-object completion with a fake analysis."""
+
+    path_prefix = "/v1"
+
+    def handle(self, method, path, body):
+        if method != "POST" or not path.rstrip("/").endswith("/chat/completions"):
+            return 404, {"error": {"message": f"not found: {method} {path}"}}
+        content = json.dumps(fake_analysis(self.requests))
+        return 200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": (body or {}).get("model", "gpt-4o-mini"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 1500, "completion_tokens": 400, "total_tokens": 1900},
+        }
+
+
+class FakeCalendar(_FakeServer):
+    """Calendar API v3 events insert/update/delete under `/calendar/v3/`."""
+
+    path_prefix = "/calendar/v3/"
+
+    def handle(self, method, path, body):
+        parts = path.split("?", 1)[0].rstrip("/").split("/")
+        if "events" not in parts:
+            return 404, {"error": {"code": 404, "message": "not found"}}
+        event_id = parts[-1] if parts[-1] != "events" else None
+        if method == "POST" and event_id is None:
+            return 200, dict(body or {}, id=uuid.uuid4().hex, status="confirmed")
+        if method in ("PUT", "PATCH") and event_id:
+            return 200, dict(body or {}, id=event_id, status="confirmed")
+        if method == "DELETE" and event_id:
+            return 204, None
+        return 405, {"error": {"code": 405, "message": f"{method} not supported"}}
@@ -0,0 +1,347 @@
+"""
+Offline end-to-end load benchmark for the FastAPI `app` in main.py.
+
+Everything runs in this process, with no AWS, OpenAI or Google account:
+  * S3 and DynamoDB are mocked in memory by moto (`mock_aws`);
+  * OpenAI chat completions and the Calendar API are local HTTP fakes (benchmarks/fakes.py)
+    with configurable latency, wired in through OPENAI_BASE_URL / GOOGLE_CALENDAR_API_URL;
+  * requests go straight to the ASGI app through httpx.ASGITransport.
+
+Workloads: upload bursts, contract list / analytics reads and folder reads on users with
+--contracts-per-user contracts (10k by default), reminder changes and PDF views.
+The report (JSON) gives count, errors, requests/sec, p50/p95/p99 latency and response
+size per endpoint, plus how many items the list endpoints actually returned. If a list
+endpoint returns fewer items than were seeded, the run fails (exit code 1), so a truncated
+read is never reported as a full-portfolio number. `upstream_calls` counts only the timed
+requests; the untimed warm-up (one request per workload, including one upload) runs
+before the counters are read. The report goes to stdout and --output; progress goes to stderr.
+
+    pip install -r requirements.txt -r benchmarks/requirements.txt
+    cd backend && python benchmarks/load.py --output load_report.json
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import platform
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from fakes import FakeCalendar, FakeOpenAI, fake_analysis  # noqa: E402
+
+BUCKET = "legalvault-bench"
+PDF_SAMPLE = 200  # seeded contracts per user that get a PDF in S3 (targets for views/reminders)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies_ms, errors, statuses, wall_s, sizes=(), item_counts=()):
+    values = sorted(latencies_ms)
+    count = len(values)
+    result = {
+        "count": count,
+        "errors": errors,
+        "statuses": dict(sorted(statuses.items())),
+        "rps": round(count / wall_s, 2) if wall_s else 0.0,
+        "mean_ms": round(sum(values) / count, 3) if count else 0.0,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3) if values else 0.0,
+        "response_bytes": {
+            "mean": round(sum(sizes) / len(sizes)) if sizes else 0,
+            "max": max(sizes) if sizes else 0,
+        },
+    }
+    if item_counts:
+        result["items"] = {"min": min(item_counts), "max": max(item_counts)}
+    return result
+
+
+def _import_fitz():
+    """Import PyMuPDF once with stdout sent to stderr: recent releases print a deprecation
+    notice for `fitz` on stdout, which would corrupt the JSON report. Later imports (here
+    and in the upload route) hit the module cache and print nothing."""
+    with contextlib.redirect_stdout(sys.stderr):
+        import fitz
+    return fitz
+
+
+def make_pdf(title, lines=40):
+    fitz = _import_fitz()
+
+    doc = fitz.open()
+    page = doc.new_page()
+    text = "\n".join(
+        [f"{title}", "SERVICE AGREEMENT", ""]
+        + [f"{i + 1}. The Provider shall deliver the services described in Schedule {i + 1}." for i in range(lines)]
+        + ["", "Signed on 15 January 2024 by both parties."]
+    )
+    page.insert_text((50, 50), text, fontsize=8)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _configure_environment(openai_url, calendar_url):
+    """Point config.py at the stand-ins. Must run before `config` / `main` are imported."""
+    os.environ.update({
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+        "AWS_SESSION_TOKEN": "testing",
+        "AWS_REGION": "us-east-1",
+        "AWS_DEFAULT_REGION": "us-east-1",
+        "S3_BUCKET_NAME": BUCKET,
+        "OPENAI_API_KEY": "sk-bench",
+        "OPENAI_BASE_URL": openai_url,
+        "GOOGLE_CALENDAR_API_URL": calendar_url,
+        "GOOGLE_CLIENT_ID": "bench-client",
+        "GOOGLE_CLIENT_SECRET": "bench-secret",
+    })
+    os.environ.pop("AWS_ENDPOINT_URL", None)
+
+
+def _create_tables(dynamodb):
+    from config import CONTRACTS_TABLE_NAME, FOLDERS_TABLE_NAME, USERS_TABLE_NAME
+
+    specs = [
+        (USERS_TABLE_NAME, [("username", "HASH")]),
+        (CONTRACTS_TABLE_NAME, [("user_id", "HASH"), ("contract_id", "RANGE")]),
+        (FOLDERS_TABLE_NAME, [("user_id", "HASH"), ("folder_id", "RANGE")]),
+    ]
+    for name, keys in specs:
+        dynamodb.create_table(
+            TableName=name,
+            KeySchema=[{"AttributeName": k, "KeyType": t} for k, t in keys],
+            AttributeDefinitions=[{"AttributeName": k, "AttributeType": "S"} for k, _ in keys],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+
+def seed(users, contracts_per_user, folders_per_user, calendar_url):
+    """Create users, contracts, folders and sample PDFs. Returns {username: [contract_ids with PDFs]}."""
+    from config import get_contracts_table, get_dynamodb, get_folders_table, get_s3_client, get_users_table
+
+    _create_tables(get_dynamodb())
+    s3 = get_s3_client()
+    s3.create_bucket(Bucket=BUCKET)
+    pdf = make_pdf("Seeded contract")
+
+    sample = {}
+    for u in range(users):
+        username = f"bench-user-{u}"
+        get_users_table().put_item(Item={
+            "username": username,
+            "password": "not-used",
+            "email": f"{username}@example.com",
+            "google_tokens": {
+                "access_token": "fake-access-token",
+                "refresh_token": "fake-refresh-token",
+                "token_uri": f"{calendar_url}token",
+                "client_id": "bench-client",
+                "client_secret": "bench-secret",
+            },
+        })
+        ids = []
+        with get_contracts_table().batch_writer() as batch:
+            for i in range(contracts_per_user):
+                contract_id = f"c-{u}-{i:06d}"
+                filename = f"contract-{i:06d}.pdf"
+                batch.put_item(Item={
+                    "user_id": username,
+                    "contract_id": contract_id,
+                    "filename": filename,
+                    "analysis": fake_analysis(i),
+                    "timestamp": datetime(2025, 1, 1 + i % 28, 9, i % 60).isoformat(),
+                    "reminder_setting": ("none", "week", "month")[i % 3],
+                })
+                if i < PDF_SAMPLE:
+                    s3.put_object(Bucket=BUCKET, Key=f"{username}/{filename}", Body=pdf)
+                    ids.append(contract_id)
+        with get_folders_table().batch_writer() as batch:
+            for f in range(folders_per_user):
+                batch.put_item(Item={
+                    "user_id": username,
+                    "folder_id": f"f-{u}-{f:03d}",
+                    "name": f"Folder {f}",
+                    "color": "#6366f1",
+                    "symbol": "📁",
+                    "contract_ids": [f"c-{u}-{j:06d}" for j in range(f, min(contracts_per_user, f + 50))],
+                })
+        sample[username] = ids
+    return sample
+
+
+async def run_workload(client, name, request_for, total, concurrency, items_key=None):
+    """Issue `total` requests built by `request_for(i)` with `concurrency` in flight.
+
+    With `items_key`, successful responses are parsed (outside the timed section) and the
+    length of that list is recorded.
+    """
+    latencies = []
+    sizes = []
+    item_counts = []
+    statuses = Counter()
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            method, url, kwargs = request_for(i)
+            t0 = time.perf_counter()
+            try:
+                resp = await client.request(method, url, **kwargs)
+                status = resp.status_code
+            except Exception:
+                resp, status = None, 0
+            latencies.append((time.perf_counter() - t0) * 1000.0)
+            statuses[status] += 1
+            if status == 0 or status >= 400:
+                errors += 1
+                continue
+            sizes.append(len(resp.content))
+            if items_key:
+                item_counts.append(len(resp.json().get(items_key) or []))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    wall = time.perf_counter() - start
+    result = summarize(latencies, errors, statuses, wall, sizes, item_counts)
+    print(f"  {name:<28} {result['count']:>6} req  {result['rps']:>9.1f} req/s  "
+          f"p50 {result['p50_ms']:.1f} ms  p99 {result['p99_ms']:.1f} ms  "
+          f"{result['response_bytes']['mean'] / 1024:.0f} KiB  errors {errors}", file=sys.stderr)
+    return result
+
+
+async def run_benchmark(args, sample, fakes):
+    import httpx
+    from main import app
+    from services.auth_service import create_access_token
+
+    users = list(sample)
+    headers = {u: {"Authorization": f"Bearer {create_access_token(data={'sub': u})}"} for u in users}
+    upload_pdf = make_pdf("Uploaded contract")
+
+    def user_for(i):
+        return users[i % len(users)]
+
+    def upload(i):
+        u = user_for(i)
+        files = {"file": (f"upload-{i:06d}.pdf", upload_pdf, "application/pdf")}
+        return "POST", "/contracts/upload", {"headers": headers[u], "files": files}
+
+    def list_contracts(i):
+        return "GET", "/contracts/", {"headers": headers[user_for(i)]}
+
+    def list_folders(i):
+        return "GET", "/folders/", {"headers": headers[user_for(i)]}
+
+    def change_reminder(i):
+        u = user_for(i)
+        ids = sample[u]
+        body = {"contract_id": ids[(i // len(users)) % len(ids)], "reminder_setting": ("week", "month", "none")[i % 3]}
+        return "POST", "/update-reminder", {"headers": headers[u], "json": body}
+
+    def view_pdf(i):
+        u = user_for(i)
+        ids = sample[u]
+        return "GET", f"/view/{ids[(i * 7) % len(ids)]}/pdf", {"headers": headers[u]}
+
+    # (name, request builder, requests, concurrency, list key, items each response should hold)
+    workloads = [
+        ("GET /contracts/", list_contracts, args.reads, args.concurrency, "contracts", args.contracts_per_user),
+        ("GET /folders/", list_folders, args.reads, args.concurrency, "folders", args.folders_per_user),
+        ("POST /update-reminder", change_reminder, args.reminders, args.concurrency, None, None),
+        ("GET /view/{contract_id}/pdf", view_pdf, args.pdf_views, args.concurrency, None, None),
+        ("POST /contracts/upload", upload, args.uploads, args.upload_concurrency, None, None),
+    ]
+    results = {}
+    warnings = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        # One untimed request per workload so lazy clients and imports are not billed to the first sample.
+        for _, request_for, total, *_ in workloads:
+            if total:
+                method, url, kwargs = request_for(0)
+                await client.request(method, url, **kwargs)
+        before = {name: fake.requests for name, fake in fakes.items()}
+        for name, request_for, total, concurrency, items_key, expected in workloads:
+            if not total:
+                continue
+            result = await run_workload(client, name, request_for, total, concurrency, items_key)
+            results[name] = result
+            if expected is not None and result.get("items", {}).get("min", expected) < expected:
+                warning = (f"{name} returned {result['items']['min']} of {expected} items; "
+                           "its latency figures describe a truncated list")
+                warnings.append(warning)
+                print(f"  WARNING: {warning}", file=sys.stderr)
+        upstream_calls = {name: fake.requests - before[name] for name, fake in fakes.items()}
+    return results, upstream_calls, warnings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=2)
+    parser.add_argument("--contracts-per-user", type=int, default=10_000)
+    parser.add_argument("--folders-per-user", type=int, default=20)
+    parser.add_argument("--reads", type=int, default=50, help="requests for each list endpoint")
+    parser.add_argument("--reminders", type=int, default=300)
+    parser.add_argument("--pdf-views", type=int, default=300)
+    parser.add_argument("--uploads", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--upload-concurrency", type=int, default=16, help="in-flight uploads per burst")
+    parser.add_argument("--openai-latency-ms", type=float, default=800.0)
+    parser.add_argument("--calendar-latency-ms", type=float, default=80.0)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    with FakeOpenAI(args.openai_latency_ms / 1000.0) as openai_fake, \
+            FakeCalendar(args.calendar_latency_ms / 1000.0) as calendar_fake:
+        _configure_environment(openai_fake.base_url, calendar_fake.base_url)
+        from moto import mock_aws
+
+        with mock_aws():
+            t0 = time.perf_counter()
+            sample = seed(args.users, args.contracts_per_user, args.folders_per_user, calendar_fake.base_url)
+            seed_s = time.perf_counter() - t0
+            print(f"seeded {args.users} users x {args.contracts_per_user} contracts in {seed_s:.1f}s",
+                  file=sys.stderr)
+            fakes = {"openai": openai_fake, "calendar": calendar_fake}
+            results, upstream_calls, warnings = asyncio.run(run_benchmark(args, sample, fakes))
+
+    report = {
+        "benchmark": "load",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": vars(args),
+        "upstream_calls": upstream_calls,
+        "warnings": warnings,
+        "endpoints": results,
+    }
+    out = json.dumps(report, indent=2)
+    print(out)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(out + "\n")
+    sys.exit(1 if warnings else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Serialization benchmark for the contract and folder list payloads.
+
+Compares, on DynamoDB-shaped items (numbers as Decimal, nested `analysis` maps):
+  * previous path: raw items -> jsonable_encoder -> JSONResponse.render
+    (what FastAPI does for a route returning a plain dict);
+  * current path: one *_from_item conversion pass -> FastJSONResponse.render.
+
+Also checks that both paths agree on every field the client reads, and that legacy or
+malformed analyses (LEGACY_CASES) are normalized the way the client's safeParse reads them.
+
+    cd backend && python benchmarks/serialization.py --contracts 10000
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from decimal import Decimal
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from fakes import fake_analysis  # noqa: E402
+from models import ContractCard, ContractInsights, contract_card_from_item  # noqa: E402
+from fast_json import FastJSONResponse  # noqa: E402
+from routers.folders import Folder, _folder_from_item  # noqa: E402
+
+
+def _dynamodb_value(value):
+    """Mimic what boto3's resource layer returns: every number becomes a Decimal."""
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {k: _dynamodb_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_dynamodb_value(v) for v in value]
+    return value
+
+
+def _analysis(i):
+    analysis = fake_analysis(i)
+    # DynamoDB keeps up to 38 digits; some values must not fit in a 64-bit int.
+    if i % 1000 == 1:
+        analysis["annual_value"] = 10 ** 25
+    if i % 1000 == 2:
+        analysis["summary"] = {"bottom_line": analysis["summary"], "max_exposure": 10 ** 30}
+    return analysis
+
+
+def contract_items(count, user_id="bench-user"):
+    return [
+        _dynamodb_value({
+            "user_id": user_id,
+            "contract_id": f"c-{i:06d}",
+            "filename": f"contract-{i:06d}.pdf",
+            "analysis": _analysis(i),
+            "timestamp": f"2025-01-{1 + i % 28:02d}T09:{i % 60:02d}:00",
+            "reminder_setting": ("none", "week", "month")[i % 3],
+            "calendar_event_id": f"evt{i}",
+        })
+        for i in range(count)
+    ]
+
+
+# (stored analysis, expected ContractInsights fields) for items the equivalence check cannot
+# cover because the stored value differs from what the client ends up reading.
+LEGACY_CASES = [
+    ({"conclusion": ["Draft agreement pending signature"]},
+     {"conclusion": "Draft agreement pending signature", "is_signed": None}),
+    ({"bottom_line": ["  Renewal terms apply.  ", "second"]}, {"conclusion": "Renewal terms apply."}),
+    ({"conclusion": "  Short conclusion. ", "bottom_line": "ignored"}, {"conclusion": "Short conclusion."}),
+    ({"conclusion": [], "bottom_line": "ignored"}, {"conclusion": None}),
+    ({"conclusion": [Decimal("1"), "x"]}, {"conclusion": None}),
+    ({"expiry_date": "", "expiry": "2027-03-01"}, {"expiry_date": "2027-03-01"}),
+    ({"execution_status": "draft"}, {"is_signed": False}),
+    ({"signed": "executed"}, {"is_signed": True}),
+    ({"annual_value": "$1,200", "notice_period_days": "60 days"},
+     {"annual_value": 1200.0, "notice_period_days": 60.0}),
+    ('{"party": "Acme", "has_auto_renewal": "yes"}', {"party": "Acme", "has_auto_renewal": True}),
+    ({"subject": Decimal("2024"), "party": Decimal("7.5"), "expiry_date": ["2027-01-01"]},
+     {"subject": "2024", "party": "7.5", "expiry_date": None}),
+    ({"subject": Decimal("0"), "party": True}, {"subject": None, "party": None}),
+]
+
+
+def check_legacy_cases():
+    for analysis, expected in LEGACY_CASES:
+        insights = contract_card_from_item({"contract_id": "legacy", "analysis": analysis})["analysis"]
+        ContractInsights.model_validate(insights)
+        for field, value in expected.items():
+            assert insights[field] == value, (analysis, field, insights[field], value)
+    return len(LEGACY_CASES)
+
+
+def folder_items(count, user_id="bench-user"):
+    return [
+        {
+            "user_id": user_id,
+            "folder_id": f"f-{i:04d}",
+            "name": f"Folder {i}",
+            "color": "#6366f1",
+            "symbol": "📁",
+            "contract_ids": [f"c-{j:06d}" for j in range(i, i + 50)],
+        }
+        for i in range(count)
+    ]
+
+
+def previous_contracts(items):
+    return JSONResponse(jsonable_encoder({"contracts": items})).body
+
+
+def current_contracts(items):
+    return FastJSONResponse({"contracts": [contract_card_from_item(item) for item in items]}).body
+
+
+def previous_folders(items):
+    return JSONResponse(jsonable_encoder({"folders": items})).body
+
+
+def current_folders(items):
+    return FastJSONResponse({"folders": [_folder_from_item(item) for item in items]}).body
+
+
+def timed(fn, arg, repeat):
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = fn(arg)
+        runs.append((time.perf_counter() - start) * 1000.0)
+    return body, runs
+
+
+def _same(old, new):
+    """Equal values; numbers too large for a 64-bit int are compared as floats."""
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)) and not isinstance(old, bool):
+        return math.isclose(old, new, rel_tol=1e-15)
+    if isinstance(old, dict) and isinstance(new, dict):
+        return old.keys() == new.keys() and all(_same(old[k], new[k]) for k in old)
+    if isinstance(old, list) and isinstance(new, list):
+        return len(old) == len(new) and all(_same(a, b) for a, b in zip(old, new))
+    return old == new
+
+
+def check_equivalent(previous_body, current_body, key, model):
+    """Fields present in the response model must match between both paths."""
+    previous = json.loads(previous_body)[key]
+    current = json.loads(current_body)[key]
+    assert len(previous) == len(current), "payload length differs"
+    fields = list(model.model_fields)
+    for old, new in zip(previous, current):
+        for field in fields:
+            if field == "analysis":
+                for sub in ContractInsights.model_fields:
+                    assert _same(old["analysis"].get(sub), new["analysis"].get(sub)), (old["contract_id"], sub)
+            else:
+                assert _same(old.get(field), new.get(field)), field
+
+
+def run_case(previous_fn, current_fn, items, key, model, repeat):
+    previous_body, previous_runs = timed(previous_fn, items, repeat)
+    current_body, current_runs = timed(current_fn, items, repeat)
+    check_equivalent(previous_body, current_body, key, model)
+    previous_ms = statistics.median(previous_runs)
+    current_ms = statistics.median(current_runs)
+    return {
+        "items": len(items),
+        "previous": {"median_ms": round(previous_ms, 2), "min_ms": round(min(previous_runs), 2),
+                     "bytes": len(previous_body)},
+        "current": {"median_ms": round(current_ms, 2), "min_ms": round(min(current_runs), 2),
+                    "bytes": len(current_body)},
+        "speedup": round(previous_ms / current_ms, 2) if current_ms else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contracts", type=int, default=10_000)
+    parser.add_argument("--folders", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = {
+        "benchmark": "serialization",
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "legacy_cases_checked": check_legacy_cases(),
+        "payloads": {
+            "GET /contracts/": run_case(previous_contracts, current_contracts,
+                                        contract_items(args.contracts), "contracts", ContractCard, args.repeat),
+            "GET /folders/": run_case(previous_folders, current_folders,
+                                      folder_items(args.folders), "folders", Folder, args.repeat),
+        },
+    }
+    out = json.dumps(report, indent=2)
+    print(out)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(out + "\n")
+
+
+if __name__ == "__main__":
+    main()
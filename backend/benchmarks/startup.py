@@ -0,0 +1,173 @@
+"""
+Startup-time benchmark for the API process.
+
+Measures, in fresh interpreters:
+  * import time of `main` (parsed from `python -X importtime`), with the slowest modules;
+  * which heavy SDKs (boto3, openai, Google clients, PyMuPDF, passlib) got imported by `import main`;
+  * time-to-first-response: spawn uvicorn and poll `GET /` until it answers.
+
+Prints a JSON report and exits non-zero if a budget is exceeded, so it can gate CI.
+
+    cd backend && python benchmarks/startup.py --runs 5 --import-budget-ms 800
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only load when a request actually needs them.
+DEFERRED_MODULES = [
+    "boto3",
+    "botocore",
+    "openai",
+    "passlib",
+    "fitz",
+    "googleapiclient",
+    "google_auth_oauthlib",
+    "google.oauth2",
+]
+
+
+def _parse_importtime(stderr):
+    """Return [(module, self_us, cumulative_us)] from `-X importtime` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, name = parts
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_import(top):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import main failed:\n{proc.stderr[-2000:]}")
+    rows = _parse_importtime(proc.stderr)
+    total_us = next((cum for name, _, cum in rows if name == "main"), 0)
+    slowest = sorted(rows, key=lambda r: r[2], reverse=True)[:top]
+    return total_us / 1000.0, [
+        {"module": name, "self_ms": round(s / 1000.0, 2), "cumulative_ms": round(c / 1000.0, 2)}
+        for name, s, c in slowest
+    ]
+
+
+def loaded_deferred_modules():
+    code = (
+        "import json, sys, main; "
+        f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"import main failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_first_response(timeout):
+    """Seconds from spawning uvicorn until `GET /` returns 200."""
+    port = _free_port()
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited early:\n{proc.stderr.read().decode()[-2000:]}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1) as resp:
+                    if resp.status == 200:
+                        return (time.perf_counter() - start) * 1000.0
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"no response within {timeout}s")
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per measurement (median is reported)")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest imports to list")
+    parser.add_argument("--import-budget-ms", type=float, default=1000.0)
+    parser.add_argument("--first-response-budget-ms", type=float, default=2500.0)
+    parser.add_argument("--skip-server", action="store_true", help="only measure imports (no uvicorn)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds to wait for the first response")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    import_runs = []
+    slowest = []
+    for _ in range(args.runs):
+        total_ms, slowest = measure_import(args.top)
+        import_runs.append(total_ms)
+    deferred_loaded = loaded_deferred_modules()
+
+    report = {
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "import_main_ms": {
+            "median": round(statistics.median(import_runs), 2),
+            "min": round(min(import_runs), 2),
+            "max": round(max(import_runs), 2),
+            "budget": args.import_budget_ms,
+        },
+        "slowest_imports": slowest,
+        "deferred_modules_loaded_at_startup": deferred_loaded,
+    }
+    failures = []
+    if report["import_main_ms"]["median"] > args.import_budget_ms:
+        failures.append(f"import main took {report['import_main_ms']['median']} ms (budget {args.import_budget_ms})")
+    if deferred_loaded:
+        failures.append(f"heavy modules imported at startup: {', '.join(deferred_loaded)}")
+
+    if not args.skip_server:
+        ttfr_runs = [measure_first_response(args.timeout) for _ in range(args.runs)]
+        report["time_to_first_response_ms"] = {
+            "median": round(statistics.median(ttfr_runs), 2),
+            "min": round(min(ttfr_runs), 2),
+            "max": round(max(ttfr_runs), 2),
+            "budget": args.first_response_budget_ms,
+        }
+        if report["time_to_first_response_ms"]["median"] > args.first_response_budget_ms:
+            failures.append(
+                f"time to first response {report['time_to_first_response_ms']['median']} ms "
+                f"(budget {args.first_response_budget_ms})"
+            )
+
+    report["failures"] = failures
+    out = json.dumps(report, indent=2)
+    print(out)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(out + "\n")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,5 @@
 import os
-import boto3
-from openai import OpenAI
-from passlib.context import CryptContext
+import threading
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,16 +11,11 @@ aws_config = {
     "region_name": os.getenv("AWS_REGION")
 }
 
-s3_client = boto3.client('s3', **aws_config)
-dynamodb = boto3.resource('dynamodb', **aws_config)
-contracts_table = dynamodb.Table('Analyzed_Contracts')
-users_table = dynamodb.Table('Users')
+# Table names
+CONTRACTS_TABLE_NAME = 'Analyzed_Contracts'
+USERS_TABLE_NAME = 'Users'
 # Contract_Folders: PK=user_id, SK=folder_id. Attributes: name, color, symbol, contract_ids (list)
-folders_table = dynamodb.Table('Contract_Folders')
-
-# AI & Auth
-ai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+FOLDERS_TABLE_NAME = 'Contract_Folders'
 
 # JWT
 JWT_SECRET = os.getenv("JWT_SECRET", "change-me-in-production-use-long-secret")
@@ -37,4 +30,65 @@ SCOPES = [
     'https://www.googleapis.com/auth/calendar.events',
     'https://www.googleapis.com/auth/userinfo.profile',
     'openid'
-]
\ No newline at end of file
+]
+# Optional Calendar API base URL (e.g. a local stand-in for load tests); default is Google's.
+GOOGLE_CALENDAR_API_URL = os.getenv("GOOGLE_CALENDAR_API_URL")
+
+
+# Clients are built on first use, not at import, so a worker can start serving
+# before boto3 / openai / passlib are loaded. Each one is created exactly once,
+# even when several requests hit a cold worker at the same time.
+_clients = {}
+_clients_lock = threading.RLock()
+
+
+def _lazy(name, factory):
+    client = _clients.get(name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(name)
+            if client is None:
+                client = factory()
+                _clients[name] = client
+    return client
+
+
+def get_s3_client():
+    def build():
+        import boto3
+        return boto3.client('s3', **aws_config)
+    return _lazy("s3", build)
+
+
+def get_dynamodb():
+    def build():
+        import boto3
+        return boto3.resource('dynamodb', **aws_config)
+    return _lazy("dynamodb", build)
+
+
+def get_contracts_table():
+    return _lazy("contracts_table", lambda: get_dynamodb().Table(CONTRACTS_TABLE_NAME))
+
+
+def get_users_table():
+    return _lazy("users_table", lambda: get_dynamodb().Table(USERS_TABLE_NAME))
+
+
+def get_folders_table():
+    return _lazy("folders_table", lambda: get_dynamodb().Table(FOLDERS_TABLE_NAME))
+
+
+# AI & Auth
+def get_ai_client():
+    def build():
+        from openai import OpenAI
+        return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _lazy("openai", build)
+
+
+def get_pwd_context():
+    def build():
+        from passlib.context import CryptContext
+        return CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _lazy("pwd_context", build)
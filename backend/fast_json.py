@@ -0,0 +1,23 @@
+"""Fast JSON response class for large payloads (contract and folder lists)."""
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from models import to_number
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return to_number(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson; DynamoDB Decimals become plain JSON numbers.
+
+    Return it directly from a route: FastAPI then skips jsonable_encoder for the payload.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_default)
@@ -3,7 +3,7 @@ import os
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
-from config import s3_client, contracts_table, users_table
+from config import get_s3_client, get_contracts_table, get_users_table
 from models import ReminderUpdate
 from deps import get_current_user
 from routers import auth, contracts, google_auth, folders
@@ -37,7 +37,7 @@ async def view_contract_pdf(
 ):
     """Stream the PDF from S3 with Content-Disposition: inline so the browser displays it (no download)."""
     user_id = current_user
-    res = contracts_table.get_item(Key={"user_id": user_id, "contract_id": contract_id})
+    res = get_contracts_table().get_item(Key={"user_id": user_id, "contract_id": contract_id})
     item = res.get("Item")
     if not item:
         raise HTTPException(status_code=404, detail="Contract not found")
@@ -47,7 +47,7 @@ async def view_contract_pdf(
     if not bucket:
         raise HTTPException(status_code=500, detail="S3 bucket not configured")
     try:
-        obj = s3_client.get_object(Bucket=bucket, Key=s3_key)
+        obj = get_s3_client().get_object(Bucket=bucket, Key=s3_key)
         body = obj["Body"].read()
     except Exception as e:
         raise HTTPException(status_code=404, detail="File not found")
@@ -78,6 +78,7 @@ async def update_reminder(
     """Update contract reminder and sync to Google Calendar (create/update/delete event)."""
     user_id = current_user
     contract_id = body.contract_id
+    contracts_table = get_contracts_table()
     setting = (body.reminder_setting or "none").strip().lower()
     if setting not in ("none", "week", "month"):
         raise HTTPException(status_code=400, detail="reminder_setting must be none, week, or month")
@@ -87,7 +88,7 @@ async def update_reminder(
     if not contract:
         raise HTTPException(status_code=404, detail="Contract not found")
 
-    user_res = users_table.get_item(Key={"username": user_id})
+    user_res = get_users_table().get_item(Key={"username": user_id})
     user = user_res.get("Item", {})
     tokens = user.get("google_tokens")
     if not tokens and setting != "none":
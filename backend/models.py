@@ -1,5 +1,8 @@
+import json
+import re
+from decimal import Decimal
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, List, Optional
 
 class ReminderUpdate(BaseModel):
     contract_id: str
@@ -8,4 +11,156 @@ class ReminderUpdate(BaseModel):
 
 class UserLogin(BaseModel):
     username: str
-    password: str
\ No newline at end of file
+    password: str
+
+
+# Response models. Routes build these payloads with the *_from_item helpers below in a
+# single pass over the DynamoDB items and return them through FastJSONResponse, so the
+# models describe the schema without being instantiated per item.
+
+class ContractInsights(BaseModel):
+    subject: Optional[str] = None
+    party: Optional[str] = None
+    expiry_date: Optional[str] = None
+    conclusion: Optional[str] = None
+    summary: Any = None  # Markdown string; older analyses may hold a list or map
+    annual_value: Optional[float] = None
+    has_auto_renewal: Optional[bool] = None
+    notice_period_days: Optional[float] = None
+    risk_flags: List[str] = []
+    risk_flags_note: Optional[str] = None
+    is_signed: Optional[bool] = None
+
+class ContractCard(BaseModel):
+    contract_id: str
+    filename: Optional[str] = None
+    timestamp: Optional[str] = None
+    reminder_setting: Optional[str] = None
+    analysis: Optional[ContractInsights] = None
+
+class ContractList(BaseModel):
+    contracts: List[ContractCard]
+
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def to_number(value):
+    """DynamoDB returns every number as Decimal; give back an int or float (other values unchanged).
+
+    Whole numbers outside the 64-bit range (DynamoDB allows 38 digits) become floats,
+    since orjson cannot encode larger ints.
+    """
+    if isinstance(value, Decimal):
+        if value == value.to_integral_value():
+            number = int(value)
+            if _INT64_MIN <= number <= _INT64_MAX:
+                return number
+        return float(value)
+    return value
+
+
+# Same word lists as the client's contractHelpers (bool / isSigned).
+_TRUE_WORDS = ("true", "1", "yes", "signed", "executed")
+_UNSIGNED_WORDS = ("false", "0", "no", "unsigned", "draft", "pending", "not signed", "not executed")
+_NUMBER_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)")
+
+
+def _number(value):
+    """Numeric field as int/float, parsing model-returned strings like "$1,200"; None if not a number."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return to_number(value)
+    if isinstance(value, str):
+        match = _NUMBER_RE.match(re.sub(r"[^0-9.-]", "", value))
+        return float(match.group()) if match else None
+    return None
+
+
+def _flag(value):
+    """Boolean field; strings count as true only for the client's 'true' words."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_WORDS
+    return False
+
+
+def _signed(value):
+    """is_signed as bool: explicit 'unsigned' words are false, anything else present is true."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() not in _UNSIGNED_WORDS
+    return True
+
+
+def _text(value):
+    return value if isinstance(value, str) else None
+
+
+def _label(value):
+    """Display text: strings as-is, truthy numbers as str (the client renders them via `||`).
+
+    Lists and maps become null; the client has no sensible rendering for them.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool) and value:
+        return str(to_number(value))
+    return None
+
+
+def _sentence(value):
+    """Like the client's oneSentence: a stripped string, or the first item of a list of strings."""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, list) and value and isinstance(value[0], str):
+        return value[0].strip()
+    return None
+
+
+def _first(data, *keys):
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def insights_from_analysis(analysis):
+    """Build a ContractInsights payload from a stored analysis (map, or JSON string for older items)."""
+    try:
+        while isinstance(analysis, str):
+            analysis = json.loads(analysis)
+    except ValueError:
+        return None
+    if not isinstance(analysis, dict):
+        return None
+    risk_flags = analysis.get("risk_flags")
+    return {
+        "subject": _label(analysis.get("subject")),
+        "party": _label(analysis.get("party")),
+        # Same fallback as _parse_expiry and the client: an empty expiry_date defers to expiry.
+        "expiry_date": _label(analysis.get("expiry_date") or analysis.get("expiry")),
+        "conclusion": _sentence(_first(analysis, "conclusion", "bottom_line")),
+        "summary": analysis.get("summary"),
+        "annual_value": _number(analysis.get("annual_value")),
+        "has_auto_renewal": _flag(analysis.get("has_auto_renewal")),
+        "notice_period_days": _number(analysis.get("notice_period_days")),
+        "risk_flags": [f for f in risk_flags if isinstance(f, str)] if isinstance(risk_flags, list) else [],
+        "risk_flags_note": _text(analysis.get("risk_flags_note")),
+        "is_signed": _signed(_first(analysis, "is_signed", "signed", "execution_status")),
+    }
+
+
+def contract_card_from_item(item):
+    """Build a ContractCard payload from an Analyzed_Contracts item."""
+    return {
+        "contract_id": item["contract_id"],
+        "filename": item.get("filename"),
+        "timestamp": item.get("timestamp"),
+        "reminder_setting": item.get("reminder_setting"),
+        "analysis": insights_from_analysis(item.get("analysis")),
+    }
@@ -1,13 +1,14 @@
 import json
 import os
 import uuid
-import fitz
 from datetime import datetime
 from fastapi import APIRouter, Depends, File, UploadFile, HTTPException
-from boto3.dynamodb.conditions import Key
-from config import s3_client, contracts_table, users_table
+from config import get_s3_client, get_contracts_table, get_users_table
 from deps import get_current_user
+from models import ContractList, contract_card_from_item
+from fast_json import FastJSONResponse
 from services.ai_service import call_openai_analysis
+from services.dynamo_service import query_all
 from services.calendar_service import (
     _get_calendar_service,
     _parse_expiry,
@@ -33,13 +34,16 @@ async def upload_contract(
     file: UploadFile = File(...),
     current_user: str = Depends(get_current_user),
 ):
+    import fitz  # PyMuPDF; only needed for uploads, so keep it off the startup path
+
     user_id = current_user
     try:
+        contracts_table = get_contracts_table()
         file_bytes = await file.read()
         doc = fitz.open(stream=file_bytes, filetype="pdf")
         text = "".join([page.get_text() for page in doc])
 
-        s3_client.put_object(Bucket=os.getenv("S3_BUCKET_NAME"), Key=f"{user_id}/{file.filename}", Body=file_bytes)
+        get_s3_client().put_object(Bucket=os.getenv("S3_BUCKET_NAME"), Key=f"{user_id}/{file.filename}", Body=file_bytes)
 
         analysis = call_openai_analysis(text)
         contract_id = str(uuid.uuid4())
@@ -56,7 +60,7 @@ async def upload_contract(
 
         expiry_date = _parse_expiry(analysis)
         if expiry_date:
-            user_res = users_table.get_item(Key={"username": user_id})
+            user_res = get_users_table().get_item(Key={"username": user_id})
             tokens = (user_res.get("Item") or {}).get("google_tokens")
             if tokens:
                 service = _get_calendar_service(tokens)
@@ -77,21 +81,26 @@ async def upload_contract(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/")
+@router.get("/", response_model=ContractList, response_class=FastJSONResponse)
 async def get_contracts(current_user: str = Depends(get_current_user)):
-    res = contracts_table.query(KeyConditionExpression=Key("user_id").eq(current_user))
-    return {"contracts": res.get("Items", [])}
+    items = query_all(
+        get_contracts_table(),
+        KeyConditionExpression="user_id = :uid",
+        ExpressionAttributeValues={":uid": current_user},
+    )
+    return FastJSONResponse({"contracts": [contract_card_from_item(item) for item in items]})
 
 
 @router.delete("/{contract_id}")
 async def delete_contract(contract_id: str, current_user: str = Depends(get_current_user)):
     user_id = current_user
+    contracts_table = get_contracts_table()
     res = contracts_table.get_item(Key={"user_id": user_id, "contract_id": contract_id})
     item = res.get("Item")
     if item:
         event_id = item.get("calendar_event_id")
         if event_id:
-            user_res = users_table.get_item(Key={"username": user_id})
+            user_res = get_users_table().get_item(Key={"username": user_id})
             tokens = (user_res.get("Item") or {}).get("google_tokens")
             if tokens:
                 service = _get_calendar_service(tokens)
@@ -2,8 +2,10 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
-from config import folders_table
+from config import get_folders_table
 from deps import get_current_user
+from fast_json import FastJSONResponse
+from services.dynamo_service import query_all
 
 router = APIRouter(prefix="/folders", tags=["Folders"])
 
@@ -21,20 +23,50 @@ class FolderUpdate(BaseModel):
     contract_ids: Optional[List[str]] = None
 
 
-@router.get("/")
+class Folder(BaseModel):
+    user_id: str
+    folder_id: str
+    name: str
+    color: Optional[str] = None
+    symbol: Optional[str] = None
+    contract_ids: List[str] = []
+
+
+class FolderList(BaseModel):
+    folders: List[Folder]
+
+
+class FolderResponse(BaseModel):
+    folder: Folder
+
+
+def _folder_from_item(item):
+    """Build a Folder payload from a Contract_Folders item."""
+    return {
+        "user_id": item["user_id"],
+        "folder_id": item["folder_id"],
+        "name": item.get("name") or "New folder",
+        "color": item.get("color"),
+        "symbol": item.get("symbol"),
+        "contract_ids": list(item.get("contract_ids") or []),
+    }
+
+
+@router.get("/", response_model=FolderList, response_class=FastJSONResponse)
 async def list_folders(current_user: str = Depends(get_current_user)):
     """List all custom folders for a user."""
     try:
-        res = folders_table.query(
+        items = query_all(
+            get_folders_table(),
             KeyConditionExpression="user_id = :uid",
             ExpressionAttributeValues={":uid": current_user},
         )
-        return {"folders": res.get("Items", [])}
+        return FastJSONResponse({"folders": [_folder_from_item(item) for item in items]})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/")
+@router.post("/", response_model=FolderResponse, response_class=FastJSONResponse)
 async def create_folder(body: FolderCreate, current_user: str = Depends(get_current_user)):
     """Create a new custom folder."""
     folder_id = str(uuid.uuid4())
@@ -47,18 +79,19 @@ async def create_folder(body: FolderCreate, current_user: str = Depends(get_curr
         "contract_ids": [],
     }
     try:
-        folders_table.put_item(Item=item)
-        return {"folder": item}
+        get_folders_table().put_item(Item=item)
+        return FastJSONResponse({"folder": _folder_from_item(item)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.patch("/{folder_id}")
+@router.patch("/{folder_id}", response_model=FolderResponse, response_class=FastJSONResponse)
 async def update_folder(
     folder_id: str, body: FolderUpdate, current_user: str = Depends(get_current_user)
 ):
     """Update folder name, color, symbol, or contract list."""
     try:
+        folders_table = get_folders_table()
         existing = folders_table.get_item(
             Key={"user_id": current_user, "folder_id": folder_id}
         )
@@ -85,7 +118,7 @@ async def update_folder(
             expr_values[":ids"] = body.contract_ids
 
         if not updates:
-            return {"folder": item}
+            return FastJSONResponse({"folder": _folder_from_item(item)})
 
         update_expr = "SET " + ", ".join(updates)
         params = {
@@ -99,7 +132,10 @@ async def update_folder(
         res = folders_table.get_item(
             Key={"user_id": current_user, "folder_id": folder_id}
         )
-        return {"folder": res.get("Item")}
+        updated = res.get("Item")
+        if not updated:
+            raise HTTPException(status_code=404, detail="Folder not found")
+        return FastJSONResponse({"folder": _folder_from_item(updated)})
     except HTTPException:
         raise
     except Exception as e:
@@ -112,7 +148,7 @@ async def delete_folder(
 ):
     """Delete a custom folder."""
     try:
-        folders_table.delete_item(
+        get_folders_table().delete_item(
             Key={"user_id": current_user, "folder_id": folder_id}
         )
         return {"status": "success"}
@@ -1,10 +1,8 @@
 import os
 from fastapi import APIRouter, Depends, Form, HTTPException
 from fastapi.responses import HTMLResponse
-from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
 from config import (
-    users_table,
+    get_users_table,
     GOOGLE_CLIENT_ID,
     GOOGLE_CLIENT_SECRET,
     REDIRECT_URI,
@@ -17,6 +15,8 @@ router = APIRouter(prefix="/auth", tags=["Google OAuth"])
 
 @router.get("/google")
 async def auth_google(current_user: str = Depends(get_current_user)):
+    from google_auth_oauthlib.flow import Flow
+
     flow = Flow.from_client_config(
         {"web": {"client_id": GOOGLE_CLIENT_ID, "client_secret": GOOGLE_CLIENT_SECRET,
                  "auth_uri": "https://accounts.google.com/o/oauth2/auth",
@@ -31,6 +31,9 @@ async def auth_google(current_user: str = Depends(get_current_user)):
 
 @router.get("/callback")
 async def auth_callback(code: str, state: str):
+    from google_auth_oauthlib.flow import Flow
+    from googleapiclient.discovery import build
+
     flow = Flow.from_client_config(
         {"web": {"client_id": GOOGLE_CLIENT_ID, "client_secret": GOOGLE_CLIENT_SECRET,
                  "auth_uri": "https://accounts.google.com/o/oauth2/auth",
@@ -44,7 +47,7 @@ async def auth_callback(code: str, state: str):
     user_info_service = build('oauth2', 'v2', credentials=creds)
     user_info = user_info_service.userinfo().get().execute()
 
-    users_table.update_item(
+    get_users_table().update_item(
         Key={'username': state},
         UpdateExpression="set google_tokens = :t, picture_url = :p",
         ExpressionAttributeValues={
@@ -70,7 +73,7 @@ async def auth_callback(code: str, state: str):
 
 @router.post("/disconnect-google")
 async def disconnect(current_user: str = Depends(get_current_user)):
-    users_table.update_item(
+    get_users_table().update_item(
         Key={"username": current_user},
         UpdateExpression="remove google_tokens, picture_url",
     )
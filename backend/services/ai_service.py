@@ -1,5 +1,5 @@
 import json
-from config import ai_client
+from config import get_ai_client
 
 def call_openai_analysis(text_content):
     prompt_instruction = """
@@ -15,7 +15,7 @@ def call_openai_analysis(text_content):
     9. "risk_flags": Array of strings for red flags present. Use exactly these keys when applicable: "auto_renewal", "exit_penalty", "non_compete", "long_commitment", "price_increase". Add a short "risk_flags_note" string (one line) explaining in plain language what the main risk is, e.g. "Auto-renews annually unless 60 days notice given." Use empty array [] and empty string for note if none.
     10. "is_signed": CRITICAL - set true ONLY if the contract is clearly EXECUTED. Check: (a) Is there a specific date when the agreement was signed or executed (e.g. "Signed: 15 January 2024", "Executed as of 2024-01-15", "Date of execution:")? (b) Do signature blocks appear FILLED (actual names or dates, not blank lines or underscores)? If BOTH (a) and (b) are clearly present, set true. If the signature area has blank lines, underscores, "By:_______________", no signed date, or you cannot confirm both parties signed with a date, set false. When in any doubt, set false.
     """
-    response = ai_client.chat.completions.create(
+    response = get_ai_client().chat.completions.create(
         model="gpt-4o-mini",
         messages=[
             {"role": "system", "content": prompt_instruction},
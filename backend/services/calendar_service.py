@@ -3,15 +3,18 @@ Create and delete Google Calendar reminder events using stored OAuth tokens.
 """
 import json
 from datetime import datetime, timedelta
-from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from config import GOOGLE_CALENDAR_API_URL
 
 
 def _get_calendar_service(token_dict):
     """Build Calendar API v3 service from stored token dict. Refreshes token if expired."""
     if not token_dict or not token_dict.get("refresh_token"):
         return None
+    # Google client libraries are slow to import; load them on first calendar call.
+    from google.oauth2.credentials import Credentials
+    from google.auth.transport.requests import Request
+    from googleapiclient.discovery import build
+
     creds = Credentials(
         token=token_dict.get("access_token"),
         refresh_token=token_dict.get("refresh_token"),
@@ -21,7 +24,8 @@ def _get_calendar_service(token_dict):
     )
     if creds.expired and creds.refresh_token:
         creds.refresh(Request())
-    return build("calendar", "v3", credentials=creds)
+    client_options = {"api_endpoint": GOOGLE_CALENDAR_API_URL} if GOOGLE_CALENDAR_API_URL else None
+    return build("calendar", "v3", credentials=creds, client_options=client_options)
 
 
 def _parse_expiry(analysis):
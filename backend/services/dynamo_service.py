@@ -0,0 +1,16 @@
+"""
+DynamoDB helpers shared by the routers.
+"""
+
+
+def query_all(table, **kwargs):
+    """Run table.query(**kwargs) and follow LastEvaluatedKey. A single page is capped at 1 MB,
+    so large portfolios would otherwise be cut off. Returns the list of all items."""
+    items = []
+    while True:
+        res = table.query(**kwargs)
+        items.extend(res.get("Items", []))
+        last_key = res.get("LastEvaluatedKey")
+        if not last_key:
+            return items
+        kwargs["ExclusiveStartKey"] = last_key